@@ -2,12 +2,12 @@
 # - MEE6 @communitymanager aynalama: set_author avatar None fix
 # - Google Sheets preload: get_all_values() ile header uyarısı yok
 
-import os, re, csv, io, base64, json, asyncio, datetime
+import os, re, csv, io, base64, json, asyncio, datetime, time
 from pathlib import Path
 
-import gspread
-from google.oauth2 import service_account
+_T0 = time.perf_counter()  # cold start ölçümü
 
+# gspread / google.oauth2 ağır: ilk kullanımda gs_client() içinde import edilir
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -28,6 +28,7 @@ GOOGLE_SERVICE_ACCOUNT_JSON = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON", "").strip
 GOOGLE_SERVICE_ACCOUNT_B64  = os.getenv("GOOGLE_SERVICE_ACCOUNT_B64", "").strip()
 GS_SHEET_ID   = os.getenv("GOOGLE_SHEET_ID", "").strip()
 GS_SHEET_NAME = os.getenv("GOOGLE_SHEET_NAME", "submissions").strip()
+RECORD_CACHE_TTL = int(os.getenv("RECORD_CACHE_TTL", "600"))  # sn; kayıt cache'inin sheet'ten yenilenme süresi
 
 # 🔁 Mirror ayarları
 MIRROR_TARGET_CHANNEL_ID  = int(os.getenv("MIRROR_TARGET_CHANNEL_ID", "0"))  # kopya mesajların gideceği kanal
@@ -36,6 +37,13 @@ COMMUNITY_MANAGER_ROLE_ID = int(os.getenv("COMMUNITY_MANAGER_ROLE_ID", "0")) # @
 MIRROR_BOT_USER_IDS = {
     int(x) for x in os.getenv("MIRROR_BOT_USER_IDS", "").replace(" ", "").split(",") if x.isdigit()
 }
+# Kesinti sonrası catch-up için taranacak kaynak kanallar (virgüllü liste)
+MIRROR_SOURCE_CHANNEL_IDS = {
+    int(x) for x in os.getenv("MIRROR_SOURCE_CHANNEL_IDS", "").replace(" ", "").split(",") if x.isdigit()
+}
+MIRROR_CATCHUP_CONCURRENCY = max(1, int(os.getenv("MIRROR_CATCHUP_CONCURRENCY", "3")))  # aynı anda taranan kanal
+MIRROR_STATE_FLUSH_SECS = max(1, int(os.getenv("MIRROR_STATE_FLUSH_SECS", "10")))  # mark dosyasının yazılma aralığı
+MIRROR_CATCHUP_RETRY_SECS = max(5, int(os.getenv("MIRROR_CATCHUP_RETRY_SECS", "60")))  # yarım kalan catch-up tekrarı
 
 # ─────────────────────────────────────────────────────────────────────
 # Sabitler / Kurallar / Metinler
@@ -91,6 +99,11 @@ def csv_append(discord_user_id: int, email: str, player_id: str):
         w.writerow([discord_user_id,"",email,player_id,"confirmed","","",
                     datetime.datetime.utcnow().isoformat()])
 
+def csv_has(discord_user_id: int) -> bool:
+    if not SAVE_PATH.exists(): return False
+    with SAVE_PATH.open("r", newline="") as f:
+        return any(r.get("discord_user_id","") == str(discord_user_id) for r in csv.DictReader(f))
+
 def csv_remove(discord_user_id: int):
     if not SAVE_PATH.exists(): return False
     rows, changed = [], False
@@ -185,6 +198,8 @@ def gs_client():
         return None, None
 
     try:
+        import gspread
+        from google.oauth2 import service_account
         scopes = [
             "https://www.googleapis.com/auth/spreadsheets",
             "https://www.googleapis.com/auth/drive",
@@ -244,6 +259,7 @@ def gs_upsert(discord_id: int, payload: dict) -> bool:
             ws.append_row(row_values, value_input_option="USER_ENTERED")
             print(f"[GS] appended new row for {discord_id}")
 
+        records_put(discord_id, row_values)
         return True
     except Exception as e:
         print("[GS] upsert error:", repr(e))
@@ -263,6 +279,134 @@ def gs_fetch_all_as_csv_bytes() -> bytes | None:
         print("[GS] export error:", repr(e))
         return None
 
+# ─────────────────────────────────────────────────────────────────────
+# Kayıt cache'i (lookup'lar sheet'e gitmez)
+# ─────────────────────────────────────────────────────────────────────
+RECORD_FIELDS = ["discord_user_id","discord_name","email","player_id",
+                 "status","log_message_id","updated_by","updated_at"]
+_records: dict[int, dict] = {}
+_records_loaded_at = 0.0   # time.monotonic(); 0 → hiç yüklenmedi
+_records_task: asyncio.Task | None = None
+_records_failed = False    # son yükleme denemesi başarısız mı
+_records_retry_at = 0.0    # yüklenemediyse bir sonraki deneme zamanı (monotonic)
+_records_backoff = 15.0    # sn; her başarısız denemede ikiye katlanır
+
+RECORDS_LOADING = "Records are still loading, please try again in a moment."
+RECORDS_UNAVAILABLE = "Registration records are unavailable right now (sheet unreachable). Please try again later."
+
+def _record_from_row(row: list) -> dict:
+    row = list(row) + [""] * (len(RECORD_FIELDS) - len(row))
+    return {k: str(v).strip() for k, v in zip(RECORD_FIELDS, row)}
+
+def records_put(discord_id: int, row_values: list):
+    """Kendi yazdığımız satırı cache'e işler (sheet'teki hâliyle aynı)."""
+    rec = _record_from_row(row_values)
+    rec["_cached_at"] = time.monotonic()
+    _records[int(discord_id)] = rec
+
+def records_drop(discord_id: int):
+    """Silinen kaydı tombstone ile işaretler; süren bir refresh eski snapshot'tan geri getirmesin."""
+    _records[int(discord_id)] = {"_deleted": True, "_cached_at": time.monotonic()}
+
+def records_fetch_rows() -> list | None:
+    """Worker thread'de çalışır: yalnızca sheet'i okur, paylaşılan state'e dokunmaz."""
+    _, ws = gs_client()
+    if not ws:
+        return None
+    try:
+        return ws.get_all_values()  # ham hücreler
+    except Exception as e:
+        print("[GS] preload error:", repr(e))
+        return None
+
+def records_apply(rows: list, started: float):
+    """Event loop'ta: okunan satırlarla cache'i değiştirir.
+    submitted_users yalnızca ilk başarılı yüklemede (startup preload) doldurulur."""
+    global _records, _records_loaded_at
+    seed_submitted = not records_ready()
+
+    fresh: dict[int, dict] = {}
+    # header varsa atla
+    start = 1 if rows and rows[0] and rows[0][0].strip().lower() == "discord_user_id" else 0
+    for row in rows[start:]:
+        uid = (row[0] if len(row) > 0 else "").strip()
+        if not uid.isdigit():
+            continue
+        rec = _record_from_row(row)
+        fresh[int(uid)] = rec
+        # reset edilen kullanıcı tekrar kayıt olabilmeli
+        if seed_submitted and rec["status"].lower() != "reset":
+            submitted_users.add(int(uid))
+
+    # Okuma sürerken yaptığımız yazmalar/silmeler eski snapshot ile ezilmesin
+    for uid, rec in _records.items():
+        if rec.get("_cached_at", 0) >= started:
+            if rec.get("_deleted"):
+                fresh.pop(uid, None)
+            else:
+                fresh[uid] = rec
+    _records = fresh
+    _records_loaded_at = time.monotonic()
+    print(f"[GS] records cached: {len(fresh)}")
+
+async def records_refresh() -> bool:
+    global _records_failed, _records_retry_at, _records_backoff
+    started = time.monotonic()
+    rows = await asyncio.to_thread(records_fetch_rows)
+    if rows is None:
+        _records_failed = True
+        _records_retry_at = time.monotonic() + _records_backoff
+        _records_backoff = min(_records_backoff * 2, max(RECORD_CACHE_TTL, 15))
+        return False
+    records_apply(rows, started)
+    _records_failed = False
+    _records_backoff = 15.0
+    return True
+
+def records_refresh_soon() -> asyncio.Task:
+    """Çalışan bir yenileme yoksa başlatır; referansı tutulur (GC'ye gitmesin)."""
+    global _records_task
+    if _records_task is None or _records_task.done():
+        _records_task = asyncio.get_running_loop().create_task(records_refresh())
+    return _records_task
+
+def records_ready() -> bool:
+    return _records_loaded_at > 0
+
+def records_status_message() -> str | None:
+    """Sheet tanımlı ama cache kullanılamıyorsa kullanıcıya gösterilecek mesaj."""
+    if not GS_SHEET_ID or records_ready():
+        return None
+    return RECORDS_UNAVAILABLE if _records_failed else RECORDS_LOADING
+
+def records_get(discord_id: int) -> dict | None:
+    """Yalnızca cache'ten okur; TTL dolduysa ya da yüklenemediyse (backoff ile) arka planda yeniler."""
+    now = time.monotonic()
+    if records_ready():
+        stale = now - _records_loaded_at > RECORD_CACHE_TTL
+    else:
+        stale = bool(GS_SHEET_ID) and now >= _records_retry_at
+    if stale:
+        records_refresh_soon()
+    rec = _records.get(int(discord_id))
+    return None if not rec or rec.get("_deleted") else rec
+
+def mask_email(email: str) -> str:
+    local, sep, domain = (email or "").partition("@")
+    if not sep:
+        return "-"
+    shown = min(2, len(local) // 2)  # kısa local part'ın en az yarısı gizli kalsın
+    return f"{local[:shown]}{'*' * max(1, len(local) - shown)}@{domain}"
+
+def record_embed(title: str, discord_id: int, rec: dict) -> discord.Embed:
+    e = discord.Embed(title=title, color=0x3498DB)
+    e.add_field(name="Discord", value=f"<@{discord_id}> (`{discord_id}`)", inline=False)
+    e.add_field(name="Email", value=mask_email(rec.get("email", "")), inline=True)
+    e.add_field(name="Player ID", value=f"`{rec.get('player_id') or '-'}`", inline=True)
+    e.add_field(name="Status", value=rec.get("status") or "-", inline=True)
+    e.set_footer(text=f"Updated: {rec.get('updated_at') or '-'} (UTC)")
+    return e
+
 # ─────────────────────────────────────────────────────────────────────
 # DM akışı + REGISTER butonu
 # ─────────────────────────────────────────────────────────────────────
@@ -298,8 +442,31 @@ class RegisterView(discord.ui.View):
     async def register_button(self, interaction: discord.Interaction, button: discord.ui.Button):
         user = interaction.user
 
-        if user.id in submitted_users:
-            await interaction.response.send_message(EPHEM_ALREADY, ephemeral=True)
+        async def reply(text: str):
+            await interaction.response.send_message(text, ephemeral=True)
+            log_first_handled_interaction("register")
+
+        # İlk preload sürüyorsa submitted_users eksik: kısa süre bekle, bitmezse tekrar denesin.
+        # Yükleme başarısız olduysa kayıt engellenmez; yerel CSV yedeğiyle kontrol edilir.
+        fallback = False
+        if GS_SHEET_ID and not records_ready():
+            task = _records_task if _records_task and not _records_task.done() else None
+            if not _records_failed:  # ilk yükleme henüz bitmedi (ya da başlamadı)
+                if task:
+                    try:
+                        await asyncio.wait_for(asyncio.shield(task), timeout=2)
+                    except Exception:
+                        pass
+                if not records_ready() and not _records_failed:
+                    await reply(RECORDS_LOADING)
+                    return
+            if not records_ready():
+                records_get(user.id)  # gerekirse (backoff ile) yeniden yüklemeyi başlatır
+                print(f"[GS] records unavailable; duplicate check for {user.id} falls back to CSV")
+                fallback = True
+
+        if user.id in submitted_users or (fallback and csv_has(user.id)):
+            await reply(EPHEM_ALREADY)
             return
 
         # DM aç
@@ -307,10 +474,10 @@ class RegisterView(discord.ui.View):
             dm = await user.create_dm()
             await dm.send(DM_GREETING)
         except:
-            await interaction.response.send_message(EPHEM_OPEN_DM, ephemeral=True)
+            await reply(EPHEM_OPEN_DM)
             return
 
-        await interaction.response.send_message("DM sent. Please check your inbox.", ephemeral=True)
+        await reply("DM sent. Please check your inbox.")
 
         def check(m: discord.Message):
             return m.author.id == user.id and isinstance(m.channel, discord.DMChannel)
@@ -467,6 +634,7 @@ async def delete_user(ctx: commands.Context, user_id_or_mention: str):
             cell = ws.find(str(uid))
             if cell:
                 ws.delete_rows(cell.row)
+                records_drop(uid)
                 await ctx.reply(f"User `<@{uid}>` deleted from Google Sheet & memory.", delete_after=8)
                 return
     except Exception as e:
@@ -521,15 +689,14 @@ async def edit_log(ctx: commands.Context, who: str):
     if not member:
         await ctx.reply("User not found."); return
 
-    _, ws = gs_client()
-    email = player_id = log_msg_id = ""
-    if ws:
-        for r in ws.get_all_records():
-            if str(r.get("discord_user_id","")) == str(member.id):
-                email = r.get("email","")
-                player_id = r.get("player_id","")
-                log_msg_id = r.get("log_message_id","")
-                break
+    rec = records_get(member.id)
+    status = records_status_message()
+    if not rec and status:
+        await ctx.reply(status); return
+    rec = rec or {}
+    email = rec.get("email","")
+    player_id = rec.get("player_id","")
+    log_msg_id = rec.get("log_message_id","")
 
     guild = ctx.guild
     log_ch = guild.get_channel(LOG_CHANNEL_ID) if guild else None
@@ -610,46 +777,130 @@ async def setup_register_slash(interaction: discord.Interaction):
     await ch.send(embed=emb, view=RegisterView())
     await interaction.response.send_message("Register post sent.", ephemeral=True)
 
+@bot.tree.command(name="my_registration", description="Show your registration status", guild=GOBJ)
+async def my_registration_slash(interaction: discord.Interaction):
+    rec = records_get(interaction.user.id)
+    status = records_status_message()
+    if not rec and status:
+        await interaction.response.send_message(status, ephemeral=True)
+        return
+    if not rec:
+        msg = ("Your registration is recorded." if interaction.user.id in submitted_users
+               else "No registration found. Click **REGISTER** to sign up.")
+        await interaction.response.send_message(msg, ephemeral=True)
+        return
+    await interaction.response.send_message(
+        embed=record_embed("Your registration", interaction.user.id, rec), ephemeral=True)
+
+@bot.tree.command(name="lookup", description="Look up a member's registration", guild=GOBJ)
+@app_commands.checks.has_permissions(manage_guild=True)
+async def lookup_slash(interaction: discord.Interaction, member: discord.Member):
+    if not ensure_mod_channel(interaction):
+        await interaction.response.send_message("Use this in the mod commands channel.", ephemeral=True)
+        return
+    rec = records_get(member.id)
+    status = records_status_message()
+    if not rec and status:
+        await interaction.response.send_message(status, ephemeral=True)
+        return
+    if not rec:
+        await interaction.response.send_message(f"No record for <@{member.id}>.", ephemeral=True)
+        return
+    await interaction.response.send_message(embed=record_embed("Registration", member.id, rec), ephemeral=True)
+
 # ─────────────────────────────────────────────────────────────────────
 # MEE6 @communitymanager aynalama (fixli)
 # ─────────────────────────────────────────────────────────────────────
 _mirrored_ids: set[int] = set()
 
+# Kanal başına son işlenen mesaj ID'si (high-water mark); restart sonrası kalıcı
+MIRROR_STATE_PATH = Path("mirror_state.json")
+_mirror_marks: dict[int, int] = {}
+_mirror_state_dirty = False
+# Catch-up'ı bitmemiş kanallar: canlı mesajlar mark'ı boşluğun ötesine taşımasın
+_catchup_pending: set[int] = set(MIRROR_SOURCE_CHANNEL_IDS)
+_catchup_lock = asyncio.Lock()
+_catchup_task: asyncio.Task | None = None
+_flush_task: asyncio.Task | None = None
+
 def MIRROR_BOT_USERIDS_OK() -> bool:
     return len(MIRROR_BOT_USER_IDS) > 0
 
-@bot.event
-async def on_message(message: discord.Message):
-    # Komutlar çalışsın:
-    await bot.process_commands(message)
+def mirror_enabled() -> bool:
+    return MIRROR_TARGET_CHANNEL_ID != 0 and COMMUNITY_MANAGER_ROLE_ID != 0 and MIRROR_BOT_USERIDS_OK()
 
-    # Aynalama devre dışıysa çık
-    if MIRROR_TARGET_CHANNEL_ID == 0 or COMMUNITY_MANAGER_ROLE_ID == 0 or not MIRROR_BOT_USERIDS_OK():
+def mirror_state_load():
+    if not MIRROR_STATE_PATH.exists(): return
+    try:
+        data = json.loads(MIRROR_STATE_PATH.read_text())
+        for k, v in data.items():
+            if str(k).isdigit() and str(v).isdigit():
+                _mirror_marks[int(k)] = int(v)
+    except Exception as e:
+        print("[MIRROR] state load error:", repr(e))
+
+def mirror_state_flush():
+    """Mark'lar değiştiyse dosyaya yazar (her mesajda değil, toplu)."""
+    global _mirror_state_dirty
+    if not _mirror_state_dirty:
         return
+    try:
+        tmp = MIRROR_STATE_PATH.with_suffix(".tmp")
+        tmp.write_text(json.dumps({str(k): v for k, v in _mirror_marks.items()}))
+        tmp.replace(MIRROR_STATE_PATH)
+        _mirror_state_dirty = False
+    except Exception as e:
+        print("[MIRROR] state save error:", repr(e))
+
+async def mirror_state_flusher():
+    while True:
+        await asyncio.sleep(MIRROR_STATE_FLUSH_SECS)
+        mirror_state_flush()
+
+def start_mirror_flusher():
+    global _flush_task
+    if _flush_task is None or _flush_task.done():
+        _flush_task = asyncio.create_task(mirror_state_flusher())
+
+def mirror_mark(channel_id: int, message_id: int) -> bool:
+    """Mark'ı yalnızca ileri taşır; değiştiyse True (flush'a kadar dirty)."""
+    global _mirror_state_dirty
+    if message_id > _mirror_marks.get(channel_id, 0):
+        _mirror_marks[channel_id] = message_id
+        _mirror_state_dirty = True
+        return True
+    return False
+
+mirror_state_load()
+
+def should_mirror(message: discord.Message) -> bool:
+    """on_message ve catch-up için ortak filtre: izinli bot + @communitymanager etiketi."""
     if message.guild is None:
-        return
+        return False
     if message.author.bot is False:
-        return
+        return False
     if message.author.id not in MIRROR_BOT_USER_IDS:
-        return
-    if message.id in _mirrored_ids:
-        return  # zaten kopyalandı
+        return False
 
     # Rol etiketi içeriyor mu?
     role_mention = f"<@&{COMMUNITY_MANAGER_ROLE_ID}>"
     content = message.content or ""
-    has_role = role_mention in content or any(
+    return role_mention in content or any(
         (getattr(r, "id", 0) == COMMUNITY_MANAGER_ROLE_ID) for r in message.role_mentions
     )
-    if not has_role:
-        return
+
+async def mirror_message(message: discord.Message) -> bool:
+    """Dedupe kontrolüyle hedef kanala kopyalar; gönderildiyse True."""
+    if message.id in _mirrored_ids:
+        return False  # zaten kopyalandı
 
     # Hedef kanal
     target = message.guild.get_channel(MIRROR_TARGET_CHANNEL_ID)
     if not target or not isinstance(target, (discord.TextChannel, discord.Thread)):
-        return
+        return False
 
     # Embed oluştur (avatar None güvenlidir)
+    content = message.content or ""
     avatar_url = getattr(getattr(message.author, "display_avatar", None), "url", None)
     chan_name  = getattr(message.channel, "name", None) or getattr(message.channel, "id", "unknown")
 
@@ -665,35 +916,138 @@ async def on_message(message: discord.Message):
         if len(message.attachments) > 1:
             e.set_footer(text=f"+{len(message.attachments)-1} more attachment(s)")
 
+    # Live + catch-up aynı mesajı aynı anda göndermesin diye send'den önce işaretle
+    _mirrored_ids.add(message.id)
     try:
         await target.send(embed=e, allowed_mentions=discord.AllowedMentions.none())
-        _mirrored_ids.add(message.id)
+        return True
     except Exception as err:
+        _mirrored_ids.discard(message.id)
         print("[MIRROR] send error:", err)
+        return False
+
+@bot.event
+async def on_message(message: discord.Message):
+    # Komutlar çalışsın:
+    await bot.process_commands(message)
+
+    # Aynalama devre dışıysa çık
+    if not mirror_enabled():
+        return
+    delivered = True
+    if should_mirror(message):
+        await mirror_message(message)
+        delivered = message.id in _mirrored_ids
+
+    # Kaynak kanalda canlı işlenen mesaj → catch-up bunu tekrar okumasın
+    # (o kanalın catch-up'ı bitmeden mark ilerlemez, yoksa kesinti boşluğu atlanır)
+    ch_id = getattr(message.channel, "id", 0)
+    if delivered and ch_id in MIRROR_SOURCE_CHANNEL_IDS and ch_id not in _catchup_pending:
+        mirror_mark(ch_id, message.id)
+
+async def mirror_catchup_channel(channel_id: int, sem: asyncio.Semaphore):
+    """Mark'tan sonraki geçmişi eskiden yeniye tarar, kaçanları normal yoldan aynalar.
+    Tarama yarım kalırsa kanal pending'de kalır: canlı mesajlar mark'ı gönderilemeyen mesajın ötesine taşımaz."""
+    complete = False
+    try:
+        async with sem:
+            complete = await _mirror_catchup_scan(channel_id)
+    finally:
+        if complete:
+            _catchup_pending.discard(channel_id)
+        mirror_state_flush()
+
+async def _mirror_catchup_scan(channel_id: int) -> bool:
+    """Tarama sonuna kadar gittiyse True; gönderim hatası/exception'da False."""
+    ch = bot.get_channel(channel_id)
+    if not ch or not isinstance(ch, (discord.TextChannel, discord.Thread)):
+        print(f"[MIRROR] catch-up: channel {channel_id} not found")
+        return True
+
+    after_id = _mirror_marks.get(channel_id)
+    if not after_id:
+        # İlk çalıştırma: tüm geçmişi taramak yerine şimdiki noktadan başla
+        if ch.last_message_id:
+            mirror_mark(channel_id, ch.last_message_id)
+        return True
+
+    seen = sent = 0
+    complete = True
+    try:
+        async for msg in ch.history(limit=None, after=discord.Object(id=after_id), oldest_first=True):
+            seen += 1
+            if should_mirror(msg):
+                if await mirror_message(msg):
+                    sent += 1
+                elif msg.id not in _mirrored_ids:
+                    # Gönderilemedi → mark burada kalsın, sonraki catch-up tekrar denesin
+                    print(f"[MIRROR] catch-up #{channel_id}: stopped at undelivered {msg.id}")
+                    complete = False
+                    break
+            mirror_mark(channel_id, msg.id)
+            if seen % 100 == 0:
+                mirror_state_flush()
+    except Exception as e:
+        print(f"[MIRROR] catch-up error #{channel_id}:", repr(e))
+        complete = False
+    print(f"[MIRROR] catch-up #{getattr(ch, 'name', channel_id)}: scanned {seen}, mirrored {sent}")
+    return complete
+
+async def mirror_catchup():
+    """Kaynak kanalları sınırlı eşzamanlılıkla tarar; üst üste binen çağrıları atlar."""
+    if not mirror_enabled() or not MIRROR_SOURCE_CHANNEL_IDS:
+        _catchup_pending.clear()
+        return
+    if _catchup_lock.locked():
+        return
+    async with _catchup_lock:
+        sem = asyncio.Semaphore(MIRROR_CATCHUP_CONCURRENCY)
+        await asyncio.gather(
+            *(mirror_catchup_channel(cid, sem) for cid in MIRROR_SOURCE_CHANNEL_IDS),
+            return_exceptions=True,
+        )
+    # Yarım kalan kanal varsa bir süre sonra tekrar dene
+    if _catchup_pending & MIRROR_SOURCE_CHANNEL_IDS:
+        print(f"[MIRROR] catch-up incomplete for {len(_catchup_pending)} channel(s); "
+              f"retrying in {MIRROR_CATCHUP_RETRY_SECS}s")
+        asyncio.get_running_loop().call_later(MIRROR_CATCHUP_RETRY_SECS, start_mirror_catchup)
+
+def start_mirror_catchup():
+    global _catchup_task
+    if _catchup_task and not _catchup_task.done():
+        return
+    # Task başlamadan önce dondur: canlı mesajlar bu kanalların mark'ını ilerletmesin
+    _catchup_pending.update(MIRROR_SOURCE_CHANNEL_IDS)
+    _catchup_task = asyncio.create_task(mirror_catchup())
+
+@bot.event
+async def on_resumed():
+    start_mirror_catchup()
 
 # ─────────────────────────────────────────────────────────────────────
 # on_ready
 # ─────────────────────────────────────────────────────────────────────
-@bot.event
-async def on_ready():
-    # Sheet varsa header’a takılmadan preload
-    _, ws = gs_client()
-    if ws:
-        try:
-            rows = ws.get_all_values()  # ham hücreler
-            # header varsa atla
-            if rows:
-                start = 1 if rows[0] and rows[0][0].strip().lower() == "discord_user_id" else 0
-                for row in rows[start:]:
-                    uid = (row[0] if len(row) > 0 else "").strip()
-                    if uid.isdigit():
-                        submitted_users.add(int(uid))
-        except Exception as e:
-            print("[GS] preload error:", repr(e))
+_ready_task: asyncio.Task | None = None
+_first_interaction_logged = False
 
-    # Restart sonrası butonun çalışması için
+@bot.event
+async def setup_hook():
+    # Restart sonrası butonun çalışması için: gateway'e bağlanmadan önce kaydet
     bot.add_view(RegisterView())
 
+def log_first_handled_interaction(kind: str):
+    """Cold start ölçümü: ilk interaction'a yanıt verildiği an (alındığı an değil)."""
+    global _first_interaction_logged
+    if _first_interaction_logged:
+        return
+    _first_interaction_logged = True
+    print(f"[BOOT] first handled interaction ({kind}) after {time.perf_counter() - _T0:.2f}s")
+
+@bot.event
+async def on_app_command_completion(interaction: discord.Interaction, command):
+    log_first_handled_interaction(f"/{command.name}")
+
+async def sync_tree():
     # Hızlı slash sync
     try:
         synced = await bot.tree.sync(guild=GOBJ)
@@ -701,6 +1055,27 @@ async def on_ready():
     except Exception as e:
         print("Slash sync err:", e)
 
-    print(f"✅ Logged in as {bot.user}")
+async def readiness():
+    """Preload (+ kayıt cache'i) ve slash sync'i birbirini beklemeden çalıştırır."""
+    t = time.perf_counter()
+    await asyncio.gather(records_refresh_soon(), sync_tree(), return_exceptions=True)
+    print(f"[BOOT] readiness done in {time.perf_counter() - t:.2f}s "
+          f"({time.perf_counter() - _T0:.2f}s since start)")
+
+@bot.event
+async def on_ready():
+    global _ready_task
+    print(f"✅ Logged in as {bot.user} ({time.perf_counter() - _T0:.2f}s since start)")
+
+    # Sheet auth + preload + slash sync arka planda; reconnect'te tekrar çalışmaz
+    if _ready_task is None:
+        _ready_task = asyncio.create_task(readiness())
+
+    # Kapalıyken kaçırılan @communitymanager mesajları
+    start_mirror_flusher()
+    start_mirror_catchup()
 
-bot.run(TOKEN)
+if __name__ == "__main__":
+    print(f"[BOOT] import done in {time.perf_counter() - _T0:.2f}s")
+    bot.run(TOKEN)
+    mirror_state_flush()